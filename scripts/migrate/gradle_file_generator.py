@@ -5,25 +5,99 @@ gradle/libs.versions.toml, gradle.properties, and .gitignore entries.
 All functions take parsed Maven data as input and return strings.
 """
 
+import functools
+import io
+import itertools
 import sys
-from collections import OrderedDict
 from typing import Optional
 
-from .pom_models import Dependency, MavenModule
-from .pom_parser import resolve_property, is_bom_import
+from .pom_models import _ANNOTATION_PROCESSOR_ARTIFACTS, Dependency, MavenModule
+from .pom_parser import flatten_properties, resolve_property
 from .maven_gradle_mappings import (
-    PLUGIN_ID_MAP, PLUGIN_SKIP,
-    to_alias, to_version_key, to_plugin_alias, gradle_config,
+    PLUGIN_ID_MAP, PLUGIN_SKIP, SCOPE_MAP,
+    to_alias, to_version_key, to_plugin_alias,
 )
 from .tech_stack_detector import (
     detect_java_version, detect_kotlin_version,
     is_spring_boot_project, is_devtools,
 )
 
+# Plugins never emitted as extra aliases in build.gradle.kts: the skip list
+# plus the Spring Boot and Kotlin plugins, which are applied explicitly.
+_BUILD_PLUGIN_SKIP = PLUGIN_SKIP | frozenset({"spring-boot-maven-plugin", "kotlin-maven-plugin"})
+
+# Dependencies wired to the annotationProcessor configuration.
+_ANNOTATION_PROCESSORS = frozenset({
+    "lombok", "mapstruct-processor", "hibernate-jpamodelgen",
+    "spring-boot-configuration-processor",
+})
+
+# Catalog alias → accessor path (spring-boot → spring.boot) and
+# module directory → Gradle project path (a/b → a:b)
+_DASH_TO_DOT = str.maketrans({"-": "."})
+_SLASH_TO_COLON = str.maketrans({"/": ":"})
+_DOT_TO_UNDERSCORE = str.maketrans({".": "_"})
+
+# Leading key segments of standard properties left out of gradle.properties
+_PROPERTY_SKIP_PREFIXES = frozenset({"maven", "java", "kotlin"})
+
+# Fixed build.gradle.kts blocks, assembled once at import instead of line by
+# line on every call. Each opens with the blank separator line.
+_JAVA_TOOLCHAIN_BLOCK = (
+    "\njava {{\n"
+    "    toolchain {{\n"
+    "        languageVersion = JavaLanguageVersion.of({java_ver})\n"
+    "    }}\n"
+    "}}\n"
+)
+_KOTLIN_BLOCK = (
+    "\nkotlin {\n"
+    "    compilerOptions {\n"
+    "        freeCompilerArgs.addAll(\"-Xjsr305=strict\")\n"
+    "    }\n"
+    "}\n"
+)
+_CONFIGURATIONS_BLOCK = (
+    "\nconfigurations {\n"
+    "    compileOnly {\n"
+    "        extendsFrom(configurations.annotationProcessor.get())\n"
+    "    }\n"
+    "}\n"
+)
+_REPOSITORIES_BLOCK = (
+    "\nrepositories {\n"
+    "    mavenCentral()\n"
+    "}\n"
+)
+_SUBPROJECTS_BLOCK = (
+    "\nsubprojects {\n"
+    "    repositories {\n"
+    "        mavenCentral()\n"
+    "    }\n"
+    "}\n"
+)
+_TEST_BLOCK = (
+    "\ntasks.withType<Test> {\n"
+    "    useJUnitPlatform()\n"
+    "}\n"
+)
+
+# Escapes for characters that cannot appear raw in a TOML basic string
+_TOML_ESCAPES = str.maketrans({
+    '"': '\\"', "\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t",
+})
+
+# Fixed fragments of a [libraries] entry, shared by every catalog line
+_LIB_PRE = '{ group = "'
+_LIB_MID_NAME = '", name = "'
+_LIB_MID_VREF = '", version.ref = "'
+_LIB_END = '" }'
+
 
 def build_version_catalog(
     root_module: MavenModule,
     child_modules: list[MavenModule],
+    all_properties: Optional[dict] = None,
 ) -> str:
     """Build a ``libs.versions.toml`` content string from parsed Maven modules.
 
@@ -38,121 +112,127 @@ def build_version_catalog(
     Args:
         root_module: The parsed root pom.xml module.
         child_modules: List of parsed child module pom.xml files.
+        all_properties: Properties of all modules merged, as returned by
+            ``merge_properties()``. Computed here when not given.
 
     Returns:
         A complete ``libs.versions.toml`` file content as a string.
     """
     all_modules = [root_module] + child_modules
-    all_properties = dict(root_module.properties)
-    for m in child_modules:
-        all_properties.update(m.properties)
+    if all_properties is None:
+        all_properties = merge_properties(root_module, child_modules)
 
-    # Inter-module artifact IDs to skip
-    module_artifact_ids = {root_module.artifact_id}
-    for cm in child_modules:
-        module_artifact_ids.add(cm.artifact_id)
+    # The same version strings (e.g. ${spring-cloud.version}) recur across
+    # modules, so memoize resolution against this call's merged properties.
+    @functools.lru_cache(maxsize=None)
+    def resolve(value):
+        return resolve_property(value, all_properties)
+
+    # Inter-module coordinates to skip in the dependency pass
+    inter_module_coords = _inter_module_coords(root_module, child_modules)
 
-    versions = OrderedDict()      # version-ref → version string
-    libraries = OrderedDict()     # alias → toml line
-    plugins_section = OrderedDict()  # alias → toml line
+    versions = {}  # version-ref → version string
+    version_refs = {}  # version string → first version-ref holding it (excluding "java")
+    libraries = {}  # alias → toml line
+    plugins_section = {}  # alias → toml line
 
     # Track seen coordinates to deduplicate
     seen_libs = set()
     seen_plugins = set()
 
     # ── Spring Boot special handling ──
-    is_boot = is_spring_boot_project(root_module)
+    root_all_plugins = root_module.plugins + root_module.plugin_management
+    is_boot = is_spring_boot_project(root_module, root_all_plugins)
     if is_boot and root_module.parent_version:
-        resolved_boot_ver = resolve_property(root_module.parent_version, all_properties) or root_module.parent_version
+        resolved_boot_ver = resolve(root_module.parent_version) or root_module.parent_version
         versions["spring-boot"] = resolved_boot_ver
+        version_refs.setdefault(resolved_boot_ver, "spring-boot")
 
     # ── Java / Kotlin versions (stored as versions for reference) ──
-    java_ver = detect_java_version(all_properties, root_module.plugins + root_module.plugin_management)
+    java_ver = detect_java_version(all_properties, root_all_plugins)
     if java_ver:
         versions["java"] = java_ver
 
-    kotlin_ver = detect_kotlin_version(all_properties, root_module.plugins + root_module.plugin_management)
+    kotlin_ver = detect_kotlin_version(all_properties, root_all_plugins)
     if kotlin_ver:
         versions["kotlin"] = kotlin_ver
+        version_refs.setdefault(kotlin_ver, "kotlin")
 
-    # ── Collect BOMs from dependencyManagement ──
-    for mod in all_modules:
-        for dep in mod.dep_management:
-            if is_bom_import(dep):
-                coord = (dep.group_id, dep.artifact_id)
-                if coord in seen_libs:
-                    continue
-                seen_libs.add(coord)
-                alias = to_alias(dep.group_id, dep.artifact_id)
-                ver = resolve_property(dep.version, all_properties) if dep.version else None
-                if ver and ver.startswith("$"):
-                    # Unresolvable property — comment out to avoid invalid TOML
-                    print(f"WARNING: Could not resolve version '{dep.version}' for "
-                          f"{dep.group_id}:{dep.artifact_id}, commenting out in catalog",
-                          file=sys.stderr)
-                    libraries[alias] = (
-                        f'# {{ group = "{dep.group_id}", name = "{dep.artifact_id}" }}'
-                        f"  # TODO: resolve version from {dep.version}"
-                    )
-                elif ver:
-                    vref = to_version_key(alias)
-                    versions[vref] = ver
-                    libraries[alias] = f'{{ group = "{dep.group_id}", name = "{dep.artifact_id}", version.ref = "{vref}" }}'
-                else:
-                    libraries[alias] = f'{{ group = "{dep.group_id}", name = "{dep.artifact_id}" }}'
-
-    # ── Collect non-BOM managed dependencies (these set default versions) ──
+    # ── Collect dependencyManagement in one pass ──
+    # BOM imports become catalog entries; other managed dependencies only
+    # record default versions for the dependency pass below.
     managed_versions = {}  # (groupId, artifactId) → version
     for mod in all_modules:
         for dep in mod.dep_management:
-            if not is_bom_import(dep) and dep.version:
-                ver = resolve_property(dep.version, all_properties) or dep.version
-                managed_versions[(dep.group_id, dep.artifact_id)] = ver
+            if not dep.is_bom:
+                if dep.version:
+                    ver = resolve(dep.version) or dep.version
+                    managed_versions[(dep.group_id, dep.artifact_id)] = ver
+                continue
+            coord = (dep.group_id, dep.artifact_id)
+            if coord in seen_libs:
+                continue
+            seen_libs.add(coord)
+            alias = to_alias(dep.group_id, dep.artifact_id)
+            ver = resolve(dep.version) if dep.version else None
+            if ver and "${" in ver:
+                # Unresolvable property — comment out to avoid invalid TOML
+                print(f"WARNING: Could not resolve version '{dep.version}' for "
+                      f"{dep.group_id}:{dep.artifact_id}, commenting out in catalog",
+                      file=sys.stderr)
+                libraries[alias] = (
+                    "# " + _library_entry(dep.group_id, dep.artifact_id) +
+                    f"  # TODO: resolve version from {dep.version}"
+                )
+            elif ver:
+                vref = to_version_key(alias)
+                versions[vref] = ver
+                version_refs.setdefault(ver, vref)
+                libraries[alias] = _library_entry(dep.group_id, dep.artifact_id, vref)
+            else:
+                libraries[alias] = _library_entry(dep.group_id, dep.artifact_id)
 
     # ── Collect all dependencies ──
+    # Inter-module dependencies are skipped by marking them as already seen
+    seen_libs.update(inter_module_coords)
     for mod in all_modules:
         for dep in mod.dependencies:
             coord = (dep.group_id, dep.artifact_id)
             if coord in seen_libs:
                 continue
-            # Skip inter-module dependencies
-            if dep.artifact_id in module_artifact_ids and dep.group_id == root_module.group_id:
-                continue
             seen_libs.add(coord)
             alias = to_alias(dep.group_id, dep.artifact_id)
 
             # Resolve version: explicit > managed > property
             ver = None
             if dep.version:
-                ver = resolve_property(dep.version, all_properties) or dep.version
+                ver = resolve(dep.version) or dep.version
             elif coord in managed_versions:
                 ver = managed_versions[coord]
 
-            if ver and ver.startswith("$"):
+            if ver and "${" in ver:
                 # Unresolvable property — comment out
                 print(f"WARNING: Could not resolve version '{ver}' for "
                       f"{dep.group_id}:{dep.artifact_id}, commenting out in catalog",
                       file=sys.stderr)
                 libraries[alias] = (
-                    f'# {{ group = "{dep.group_id}", name = "{dep.artifact_id}" }}'
+                    "# " + _library_entry(dep.group_id, dep.artifact_id) +
                     f"  # TODO: resolve version from {ver}"
                 )
             elif ver:
                 vref = to_version_key(alias)
                 # Deduplicate version refs if same version already tracked
-                existing_vref = None
-                for k, v in versions.items():
-                    if v == ver and k != "java":
-                        existing_vref = k
-                        break
-                if existing_vref:
+                # (the ref may be stale if a later BOM reused its key)
+                existing_vref = version_refs.get(ver)
+                if existing_vref and versions[existing_vref] == ver:
                     vref = existing_vref
                 else:
                     versions[vref] = ver
-                libraries[alias] = f'{{ group = "{dep.group_id}", name = "{dep.artifact_id}", version.ref = "{vref}" }}'
+                    version_refs[ver] = vref
+                libraries[alias] = _library_entry(dep.group_id, dep.artifact_id, vref)
             else:
                 # Version managed by BOM or Spring Boot parent — no version in catalog
-                libraries[alias] = f'{{ group = "{dep.group_id}", name = "{dep.artifact_id}" }}'
+                libraries[alias] = _library_entry(dep.group_id, dep.artifact_id)
 
     # ── Collect plugins ──
     if is_boot:
@@ -168,7 +248,7 @@ def build_version_catalog(
         seen_plugins.add("kotlin-maven-plugin")
 
     for mod in all_modules:
-        for p in mod.plugins + mod.plugin_management:
+        for p in itertools.chain(mod.plugins, mod.plugin_management):
             if p.artifact_id in seen_plugins or p.artifact_id in PLUGIN_SKIP:
                 continue
             seen_plugins.add(p.artifact_id)
@@ -176,8 +256,8 @@ def build_version_catalog(
             if not gradle_id:
                 continue
             alias = to_plugin_alias(p.group_id, p.artifact_id)
-            ver = resolve_property(p.version, all_properties) if p.version else None
-            if ver and ver.startswith("$"):
+            ver = resolve(p.version) if p.version else None
+            if ver and "${" in ver:
                 print(f"WARNING: Could not resolve plugin version '{p.version}' for "
                       f"{p.artifact_id}, omitting version in catalog",
                       file=sys.stderr)
@@ -190,45 +270,132 @@ def build_version_catalog(
                 plugins_section[alias] = f'{{ id = "{gradle_id}" }}'
 
     # ── Render TOML ──
-    lines = ["[versions]"]
-    for k, v in versions.items():
-        lines.append(f'{k} = "{v}"')
+    # Each section is joined in one go; every entry carries its own newline
+    parts = [
+        "[versions]\n",
+        "".join(f'{k} = "{v.translate(_TOML_ESCAPES)}"\n' for k, v in versions.items()),
+        "\n[libraries]\n",
+        "".join(f"{alias} = {definition}\n" for alias, definition in libraries.items()),
+    ]
+    if plugins_section:
+        parts.append("\n[plugins]\n")
+        parts.append("".join(f"{alias} = {definition}\n" for alias, definition in plugins_section.items()))
+    return "".join(parts)
 
-    lines.append("")
-    lines.append("[libraries]")
-    for alias, definition in libraries.items():
-        lines.append(f"{alias} = {definition}")
 
-    if plugins_section:
-        lines.append("")
-        lines.append("[plugins]")
-        for alias, definition in plugins_section.items():
-            lines.append(f"{alias} = {definition}")
+def merge_properties(root_module: MavenModule, child_modules: list[MavenModule]) -> dict:
+    """Merge the properties of the root and all child modules.
 
-    lines.append("")
-    return "\n".join(lines)
+    Later modules override earlier ones, matching declaration order. The
+    merged map is then flattened once with ``flatten_properties()``, so
+    chained references resolve against the overridden values.
 
+    Args:
+        root_module: The parsed root MavenModule.
+        child_modules: List of parsed child MavenModule instances.
 
-def _is_inter_module_dep(dep: Dependency, root_module: MavenModule, child_modules: list) -> Optional[str]:
-    """Check if a dependency refers to another module in the same multi-module project.
+    Returns:
+        A new dict of property name → resolved value.
+    """
+    merged = dict(root_module.properties)
+    for m in child_modules:
+        merged.update(m.properties)
+    return flatten_properties(merged)
 
-    Matches by artifactId + groupId against the root and all child modules.
+
+def _library_entry(group_id: str, artifact_id: str, vref: Optional[str] = None) -> str:
+    """Render the inline table for a ``[libraries]`` catalog entry.
+
+    Args:
+        group_id: The dependency groupId.
+        artifact_id: The dependency artifactId.
+        vref: Optional ``[versions]`` key to reference.
+
+    Returns:
+        The TOML inline table, e.g. ``{ group = "g", name = "a", version.ref = "v" }``.
+    """
+    group_id = group_id.translate(_TOML_ESCAPES)
+    artifact_id = artifact_id.translate(_TOML_ESCAPES)
+    if vref:
+        return "".join((_LIB_PRE, group_id, _LIB_MID_NAME, artifact_id, _LIB_MID_VREF, vref, _LIB_END))
+    return "".join((_LIB_PRE, group_id, _LIB_MID_NAME, artifact_id, _LIB_END))
+
+
+@functools.lru_cache(maxsize=4096)
+def _safe_alias(group_id: str, artifact_id: str) -> str:
+    """Return the ``libs.`` accessor path for a library's catalog alias.
+
+    The same coordinates recur across every child build, so the dotted form
+    is cached alongside ``to_alias()`` rather than re-translated per module.
+
+    Args:
+        group_id: The Maven groupId.
+        artifact_id: The Maven artifactId.
+
+    Returns:
+        The alias with dashes replaced by dots (e.g. ``spring.boot.starter.web``).
+    """
+    return to_alias(group_id, artifact_id).translate(_DASH_TO_DOT)
+
+
+def _inter_module_coords(root_module: MavenModule, child_modules: list) -> dict:
+    """Map the coordinates of every module in the project to its source directory.
+
+    All modules are keyed under the root module's groupId, matching how
+    inter-module dependencies are declared in a reactor build.
 
     Args:
-        dep: The dependency to check.
         root_module: The root MavenModule.
         child_modules: List of child MavenModule instances.
 
+    Returns:
+        A dict of ``(groupId, artifactId)`` → source directory, with ``"."``
+        for the root module.
+    """
+    group_id = root_module.group_id
+    coords = {(group_id, root_module.artifact_id): "."}
+    for cm in child_modules:
+        coords[(group_id, cm.artifact_id)] = cm.source_dir or cm.artifact_id
+    return coords
+
+
+def _is_inter_module_dep(dep: Dependency, inter_module_coords: dict) -> Optional[str]:
+    """Check if a dependency refers to another module in the same multi-module project.
+
+    Matches by groupId + artifactId against the precomputed module coordinates.
+
+    Args:
+        dep: The dependency to check.
+        inter_module_coords: Coordinates from ``_inter_module_coords()``.
+
     Returns:
         The module's source directory name if it's an inter-module dependency,
         or ``None`` if it's an external dependency.
     """
-    all_artifact_ids = {root_module.artifact_id: "."}
-    for cm in child_modules:
-        all_artifact_ids[cm.artifact_id] = cm.source_dir or cm.artifact_id
-    if dep.artifact_id in all_artifact_ids and dep.group_id == root_module.group_id:
-        return all_artifact_ids[dep.artifact_id]
-    return None
+    return inter_module_coords.get((dep.group_id, dep.artifact_id))
+
+
+def project_context(root_module: MavenModule, child_modules: Optional[list] = None) -> dict:
+    """Compute the root-derived values shared by every module's build file.
+
+    Java and Kotlin versions are not included: they are detected from the
+    root and module properties merged, so they can differ per module.
+
+    Args:
+        root_module: The parsed root MavenModule.
+        child_modules: List of child MavenModule instances, if any.
+
+    Returns:
+        A dict with ``root_all_plugins`` (root plugins followed by its
+        pluginManagement), ``is_boot`` (Spring Boot detection result) and
+        ``inter_module_coords`` (from ``_inter_module_coords()``).
+    """
+    root_all_plugins = root_module.plugins + root_module.plugin_management
+    return {
+        "root_all_plugins": root_all_plugins,
+        "is_boot": is_spring_boot_project(root_module, root_all_plugins),
+        "inter_module_coords": _inter_module_coords(root_module, child_modules or []),
+    }
 
 
 def generate_build_gradle_kts(
@@ -237,7 +404,7 @@ def generate_build_gradle_kts(
     is_root: bool = True,
     is_multi_module: bool = False,
     child_modules: list = None,
-
+    project_ctx: Optional[dict] = None,
 ) -> str:
     """Generate ``build.gradle.kts`` content for a single module.
 
@@ -252,227 +419,179 @@ def generate_build_gradle_kts(
         is_root: Whether this is the root module.
         is_multi_module: Whether the project is multi-module.
         child_modules: List of child MavenModule instances (for inter-module deps).
+        project_ctx: Root-derived values from ``project_context()``, shared
+            across every module of one project. Computed here when not given.
 
     Returns:
         Complete ``build.gradle.kts`` file content as a string.
     """
-    lines = []
+    # Sections after the plugins block each open with a blank separator line
+    buf = io.StringIO()
     all_properties = dict(root_module.properties)
     all_properties.update(module.properties)
 
-    is_boot = is_spring_boot_project(root_module)
-    has_kotlin = detect_kotlin_version(all_properties, root_module.plugins + root_module.plugin_management) is not None
-    java_ver = detect_java_version(all_properties, root_module.plugins + root_module.plugin_management)
+    if project_ctx is None:
+        project_ctx = project_context(root_module, child_modules)
+    root_all_plugins = project_ctx["root_all_plugins"]
+    is_boot = project_ctx["is_boot"]
+    has_kotlin = detect_kotlin_version(all_properties, root_all_plugins) is not None
+    java_ver = detect_java_version(all_properties, root_all_plugins)
+
+    # Module-invariant flags, evaluated once instead of in every section
+    is_aggregator = is_multi_module and module.packaging == "pom"
+    is_root_aggregator = is_aggregator and is_root
+
+    # One scan for both dependency-derived flags, instead of one per property
+    has_tests = has_annotation_processor = False
+    for dep in module.dependencies:
+        if dep.scope == "test":
+            has_tests = True
+        if dep.scope == "provided" or dep.artifact_id in _ANNOTATION_PROCESSOR_ARTIFACTS:
+            has_annotation_processor = True
+        if has_tests and has_annotation_processor:
+            break
 
     # ── Plugins block ──
-    if is_root or not is_multi_module:
-        lines.append("plugins {")
-
-        if module.packaging == "pom" and is_multi_module:
-            # Root POM in multi-module — plugins applied with apply false
-            if is_boot:
-                lines.append("    alias(libs.plugins.spring.boot) apply false")
-                lines.append("    alias(libs.plugins.spring.dependency.management) apply false")
-            if has_kotlin:
-                lines.append("    alias(libs.plugins.kotlin.jvm) apply false")
-                lines.append("    alias(libs.plugins.kotlin.spring) apply false")
-        else:
-            # Apply Java or Kotlin plugin
-            if has_kotlin:
-                lines.append("    alias(libs.plugins.kotlin.jvm)")
-                lines.append("    alias(libs.plugins.kotlin.spring)")
-            else:
-                lines.append("    java")
-
-            if is_boot:
-                lines.append("    alias(libs.plugins.spring.boot)")
-                lines.append("    alias(libs.plugins.spring.dependency.management)")
-
-        # Additional plugins
-        for p in module.plugins:
-            if p.artifact_id in PLUGIN_SKIP or p.artifact_id in (
-                "spring-boot-maven-plugin", "kotlin-maven-plugin"
-            ):
-                continue
-            gradle_id = PLUGIN_ID_MAP.get(p.artifact_id)
-            if gradle_id:
-                alias = to_plugin_alias(p.group_id, p.artifact_id)
-                safe_alias = alias.replace("-", ".")
-                lines.append(f"    alias(libs.plugins.{safe_alias})")
-
-        lines.append("}")
-        lines.append("")
+    buf.write("plugins {\n")
+    if is_root_aggregator:
+        # Root POM in multi-module — plugins applied with apply false
+        if is_boot:
+            buf.write("    alias(libs.plugins.spring.boot) apply false\n")
+            buf.write("    alias(libs.plugins.spring.dependency.management) apply false\n")
+        if has_kotlin:
+            buf.write("    alias(libs.plugins.kotlin.jvm) apply false\n")
+            buf.write("    alias(libs.plugins.kotlin.spring) apply false\n")
     else:
-        # Child module in multi-module
-        lines.append("plugins {")
+        # Apply Java or Kotlin plugin
         if has_kotlin:
-            lines.append("    alias(libs.plugins.kotlin.jvm)")
-            lines.append("    alias(libs.plugins.kotlin.spring)")
+            buf.write("    alias(libs.plugins.kotlin.jvm)\n")
+            buf.write("    alias(libs.plugins.kotlin.spring)\n")
         else:
-            lines.append("    java")
+            buf.write("    java\n")
+
         if is_boot:
-            lines.append("    alias(libs.plugins.spring.boot)")
-            lines.append("    alias(libs.plugins.spring.dependency.management)")
-        for p in module.plugins:
-            if p.artifact_id in PLUGIN_SKIP or p.artifact_id in (
-                "spring-boot-maven-plugin", "kotlin-maven-plugin"
-            ):
-                continue
-            gradle_id = PLUGIN_ID_MAP.get(p.artifact_id)
-            if gradle_id:
-                alias = to_plugin_alias(p.group_id, p.artifact_id)
-                safe_alias = alias.replace("-", ".")
-                lines.append(f"    alias(libs.plugins.{safe_alias})")
-        lines.append("}")
-        lines.append("")
+            buf.write("    alias(libs.plugins.spring.boot)\n")
+            buf.write("    alias(libs.plugins.spring.dependency.management)\n")
+
+    # Additional plugins
+    for p in module.plugins:
+        if p.artifact_id in _BUILD_PLUGIN_SKIP:
+            continue
+        gradle_id = PLUGIN_ID_MAP.get(p.artifact_id)
+        if gradle_id:
+            alias = to_plugin_alias(p.group_id, p.artifact_id)
+            safe_alias = alias.translate(_DASH_TO_DOT)
+            buf.write(f"    alias(libs.plugins.{safe_alias})\n")
+    buf.write("}\n")
 
     # ── Group / Version ──
     if is_root or not is_multi_module:
-        lines.append(f'group = "{module.group_id}"')
+        buf.write(f'\ngroup = "{module.group_id}"\n')
         if module.version:
-            lines.append(f'version = "{module.version}"')
-        lines.append("")
+            buf.write(f'version = "{module.version}"\n')
 
     # ── Java toolchain ──
-    if java_ver and not (is_multi_module and module.packaging == "pom"):
-        lines.append("java {")
-        lines.append("    toolchain {")
-        lines.append(f"        languageVersion = JavaLanguageVersion.of({java_ver})")
-        lines.append("    }")
-        lines.append("}")
-        lines.append("")
+    if java_ver and not is_aggregator:
+        buf.write(_JAVA_TOOLCHAIN_BLOCK.format(java_ver=java_ver))
 
     # ── Kotlin compiler options ──
-    if has_kotlin and not (is_multi_module and module.packaging == "pom"):
-        lines.append("kotlin {")
-        lines.append("    compilerOptions {")
-        lines.append("        freeCompilerArgs.addAll(\"-Xjsr305=strict\")")
-        lines.append("    }")
-        lines.append("}")
-        lines.append("")
+    if has_kotlin and not is_aggregator:
+        buf.write(_KOTLIN_BLOCK)
 
     # ── Configurations (for optional/compileOnly patterns) ──
-    has_annotation_processor = any(
-        d.scope == "provided" or d.artifact_id in ("lombok", "mapstruct-processor")
-        for d in module.dependencies
-    )
-
     if has_annotation_processor and has_kotlin:
-        lines.append("configurations {")
-        lines.append("    compileOnly {")
-        lines.append("        extendsFrom(configurations.annotationProcessor.get())")
-        lines.append("    }")
-        lines.append("}")
-        lines.append("")
+        buf.write(_CONFIGURATIONS_BLOCK)
 
     # ── Repositories ──
     if is_root:
-        lines.append("repositories {")
-        lines.append("    mavenCentral()")
-        lines.append("}")
-        lines.append("")
+        buf.write(_REPOSITORIES_BLOCK)
 
     # ── Dependencies ──
-    if module.dependencies and not (is_multi_module and module.packaging == "pom" and is_root):
-        lines.append("dependencies {")
+    if module.dependencies and not is_root_aggregator:
+        inter_module_coords = project_ctx["inter_module_coords"]
+        # Bound dict.get in place of gradle_config() for the per-dependency lookups
+        scope_config = SCOPE_MAP.get
+        buf.write("\ndependencies {\n")
 
         # BOMs from dependencyManagement
         for dep in module.dep_management:
-            if is_bom_import(dep):
-                alias = to_alias(dep.group_id, dep.artifact_id)
-                safe_alias = alias.replace("-", ".")
-                lines.append(f"    implementation(platform(libs.{safe_alias}))")
+            if dep.is_bom:
+                safe_alias = _safe_alias(dep.group_id, dep.artifact_id)
+                buf.write(f"    implementation(platform(libs.{safe_alias}))\n")
 
         for dep in module.dependencies:
             # Check if inter-module dependency
-            mod_dir = _is_inter_module_dep(dep, root_module, child_modules or [])
+            mod_dir = _is_inter_module_dep(dep, inter_module_coords)
             if mod_dir:
-                config = gradle_config(dep.scope)
-                lines.append(f'    {config}(project(":{dep.artifact_id}"))')
+                config = scope_config(dep.scope, "implementation")
+                buf.write(f'    {config}(project(":{dep.artifact_id}"))\n')
                 continue
 
-            alias = to_alias(dep.group_id, dep.artifact_id)
-            safe_alias = alias.replace("-", ".")
-            config = gradle_config(dep.scope)
+            dep_ref = "libs." + _safe_alias(dep.group_id, dep.artifact_id)
+            config = scope_config(dep.scope, "implementation")
 
             # DevTools → developmentOnly
             if is_devtools(dep):
-                lines.append(f"    developmentOnly(libs.{safe_alias})")
+                buf.write(f"    developmentOnly({dep_ref})\n")
                 continue
 
             # Annotation processors
-            is_apt = dep.artifact_id in (
-                "lombok", "mapstruct-processor", "hibernate-jpamodelgen",
-                "spring-boot-configuration-processor",
-            )
+            is_apt = dep.artifact_id in _ANNOTATION_PROCESSORS
 
             if is_apt:
-                dep_ref = f"libs.{safe_alias}"
                 if dep.scope == "test":
                     # Test-only annotation processor
-                    lines.append(f"    testCompileOnly({dep_ref})")
-                    lines.append(f"    testAnnotationProcessor({dep_ref})")
+                    buf.write(f"    testCompileOnly({dep_ref})\n")
+                    buf.write(f"    testAnnotationProcessor({dep_ref})\n")
                 else:
                     if dep.scope == "provided" or dep.optional:
-                        lines.append(f"    compileOnly({dep_ref})")
-                    lines.append(f"    annotationProcessor({dep_ref})")
+                        buf.write(f"    compileOnly({dep_ref})\n")
+                    buf.write(f"    annotationProcessor({dep_ref})\n")
             elif dep.exclusions:
-                lines.append(f"    {config}(libs.{safe_alias}) {{")
+                buf.write(f"    {config}({dep_ref}) {{\n")
                 for eg, ea in dep.exclusions:
-                    lines.append(f'        exclude(group = "{eg}", module = "{ea}")')
-                lines.append("    }")
+                    buf.write(f'        exclude(group = "{eg}", module = "{ea}")\n')
+                buf.write("    }\n")
             else:
                 if dep.optional and config == "implementation":
                     config = "compileOnly"
-                lines.append(f"    {config}(libs.{safe_alias})")
+                buf.write(f"    {config}({dep_ref})\n")
 
-        lines.append("}")
-        lines.append("")
+        buf.write("}\n")
 
     # ── allprojects / subprojects for multi-module root ──
-    if is_multi_module and module.packaging == "pom" and is_root:
-        lines.append("allprojects {")
-        lines.append(f'    group = "{module.group_id}"')
+    if is_root_aggregator:
+        buf.write("\nallprojects {\n")
+        buf.write(f'    group = "{module.group_id}"\n')
         if module.version:
-            lines.append(f'    version = "{module.version}"')
-        lines.append("}")
-        lines.append("")
-        lines.append("subprojects {")
-        lines.append("    repositories {")
-        lines.append("        mavenCentral()")
-        lines.append("    }")
-        lines.append("}")
-        lines.append("")
+            buf.write(f'    version = "{module.version}"\n')
+        buf.write("}\n")
+        buf.write(_SUBPROJECTS_BLOCK)
 
     # ── Test configuration ──
-    has_tests = any(d.scope == "test" for d in module.dependencies)
-    if has_tests and not (is_multi_module and module.packaging == "pom"):
-        lines.append("tasks.withType<Test> {")
-        lines.append("    useJUnitPlatform()")
-        lines.append("}")
-        lines.append("")
+    if has_tests and not is_aggregator:
+        buf.write(_TEST_BLOCK)
 
     # ── Profile conversion hints (as comments) ──
     if module.profiles:
-        lines.append("// ── Maven profile equivalents ─────────────────────────────────")
-        lines.append("// See references/profiles.md in the migration skill for patterns.")
+        buf.write("\n// ── Maven profile equivalents ─────────────────────────────────\n")
+        buf.write("// See references/profiles.md in the migration skill for patterns.\n")
         for prof in module.profiles:
-            lines.append(f"// Profile '{prof.profile_id}':")
+            buf.write(f"// Profile '{prof.profile_id}':\n")
             if prof.activation.get("activeByDefault"):
-                lines.append("//   → Active by default: apply unconditionally or use a Gradle property")
+                buf.write("//   → Active by default: apply unconditionally or use a Gradle property\n")
             if "property" in prof.activation:
                 prop = prof.activation["property"]
-                lines.append(f'//   → Activated by property: -P{prop.get("name", "?")}={prop.get("value", "")}')
-                lines.append(f'//   → Gradle equivalent: if (project.hasProperty("{prop.get("name", "")}")) {{ ... }}')
+                buf.write(f'//   → Activated by property: -P{prop.get("name", "?")}={prop.get("value", "")}\n')
+                buf.write(f'//   → Gradle equivalent: if (project.hasProperty("{prop.get("name", "")}")) {{ ... }}\n')
             if "jdk" in prof.activation:
-                lines.append(f"//   → JDK activation: {prof.activation['jdk']}")
+                buf.write(f"//   → JDK activation: {prof.activation['jdk']}\n")
             if prof.dependencies:
-                lines.append(f"//   → Has {len(prof.dependencies)} dependencies")
+                buf.write(f"//   → Has {len(prof.dependencies)} dependencies\n")
             if prof.plugins:
-                lines.append(f"//   → Has {len(prof.plugins)} plugins")
-        lines.append("")
+                buf.write(f"//   → Has {len(prof.plugins)} plugins\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_settings_gradle_kts(
@@ -497,7 +616,7 @@ def generate_settings_gradle_kts(
     Returns:
         Complete ``settings.gradle.kts`` file content as a string.
     """
-    lines = []
+    buf = io.StringIO()
     child_modules = child_modules or []
 
     # Collect all custom repositories from root + children
@@ -518,39 +637,38 @@ def generate_settings_gradle_kts(
 
     # Generate pluginManagement block (always for multi-module or custom repos)
     if has_custom_repos or root_module.modules:
-        lines.append("pluginManagement {")
-        lines.append("    repositories {")
-        lines.append("        mavenCentral()")
-        lines.append("        gradlePluginPortal()")
+        buf.write("pluginManagement {\n")
+        buf.write("    repositories {\n")
+        buf.write("        mavenCentral()\n")
+        buf.write("        gradlePluginPortal()\n")
         for _repo_id, repo_url in unique_repos:
-            lines.append(f'        maven {{ url = uri("{repo_url}") }}')
-        lines.append("    }")
-        lines.append("}")
-        lines.append("")
+            buf.write(f'        maven {{ url = uri("{repo_url}") }}\n')
+        buf.write("    }\n")
+        buf.write("}\n")
+        buf.write("\n")
 
     # Generate dependencyResolutionManagement block if custom repos exist
     if has_custom_repos:
-        lines.append("dependencyResolutionManagement {")
-        lines.append("    repositories {")
-        lines.append("        mavenCentral()")
+        buf.write("dependencyResolutionManagement {\n")
+        buf.write("    repositories {\n")
+        buf.write("        mavenCentral()\n")
         for _repo_id, repo_url in unique_repos:
-            lines.append(f'        maven {{ url = uri("{repo_url}") }}')
-        lines.append("    }")
-        lines.append("}")
-        lines.append("")
+            buf.write(f'        maven {{ url = uri("{repo_url}") }}\n')
+        buf.write("    }\n")
+        buf.write("}\n")
+        buf.write("\n")
 
     project_name = root_module.artifact_id
-    lines.append(f'rootProject.name = "{project_name}"')
-    lines.append("")
+    buf.write(f'rootProject.name = "{project_name}"\n')
 
     if child_modules:
+        buf.write("\n")
         for child in child_modules:
             # Convert filesystem path (a/b) to Gradle include path (a:b)
-            gradle_path = child.source_dir.replace("/", ":")
-            lines.append(f'include("{gradle_path}")')
-        lines.append("")
+            gradle_path = child.source_dir.translate(_SLASH_TO_COLON)
+            buf.write(f'include("{gradle_path}")\n')
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_gradle_properties(root_module: MavenModule) -> str:
@@ -578,14 +696,17 @@ def generate_gradle_properties(root_module: MavenModule) -> str:
     ]
     # Carry over relevant Maven properties
     for key, value in root_module.properties.items():
-        if key.startswith("project.build.sourceEncoding"):
-            lines.append(f"# Source encoding: {value}")
-        elif key.startswith("project.reporting.outputEncoding"):
+        head, dot, _ = key.partition(".")
+        if dot and head in _PROPERTY_SKIP_PREFIXES:
             continue
-        elif not key.startswith("maven.") and not key.startswith("java.") and not key.startswith("kotlin."):
-            # Custom properties — include as Gradle project properties
-            safe_key = key.replace(".", "_")
-            lines.append(f"# {safe_key}={value}")
+        if head == "project":
+            if key.startswith("project.build.sourceEncoding"):
+                lines.append(f"# Source encoding: {value}")
+                continue
+            if key.startswith("project.reporting.outputEncoding"):
+                continue
+        # Custom properties — include as Gradle project properties
+        lines.append(f"# {key.translate(_DOT_TO_UNDERSCORE)}={value}")
     lines.append("")
     return "\n".join(lines)
 
@@ -1,10 +1,29 @@
 """Maven-to-Gradle translation tables and alias generation.
 
 Pure mapping logic with no XML parsing, no file I/O, and no internal
-package imports. All functions are stateless string transformations.
+package imports. All functions are stateless string transformations; the
+alias generators are memoized since the same coordinates recur across modules.
 """
 
+import functools
 import re
+import string
+
+
+class _SanitizeTable(dict):
+    """``str.translate`` table mapping every character outside ``[a-zA-Z0-9-]`` to ``-``.
+
+    Allowed ASCII characters map to themselves; any other code point is
+    mapped to a hyphen on first sight and cached.
+    """
+
+    def __missing__(self, code):
+        self[code] = "-"
+        return "-"
+
+
+_SANITIZE_TABLE = _SanitizeTable({ord(c): ord(c) for c in string.ascii_letters + string.digits + "-"})
+_RE_DEDUP_DASH = re.compile(r"-{2,}")
 
 # Maven scope → Gradle configuration mapping.
 # Key difference: Maven's "compile" is transitive; Gradle's "implementation" is NOT.
@@ -47,7 +66,7 @@ PLUGIN_ID_MAP = {
 # Maven plugins that have no direct Gradle plugin equivalent.
 # These are handled via built-in Gradle tasks, conventions, or are unnecessary.
 # Each entry documents the Gradle alternative as an inline comment.
-PLUGIN_SKIP = {
+PLUGIN_SKIP = frozenset({
     "maven-compiler-plugin",        # → java toolchain / kotlin options
     "maven-surefire-plugin",        # → test task config
     "maven-failsafe-plugin",        # → custom integration test task
@@ -66,22 +85,107 @@ PLUGIN_SKIP = {
     "versions-maven-plugin",        # → version catalog + dependabot
     "flatten-maven-plugin",         # → not needed in Gradle
     "maven-antrun-plugin",          # → ant integration in Gradle
+})
+
+
+# Common Maven groupId prefixes collapsed into short catalog alias prefixes.
+# Lookup is longest-prefix-wins (see _PREFIX_LENGTHS), so entry order here is
+# purely for readability; more-specific prefixes always take precedence.
+_PREFIX_MAP = {
+    # Spring ecosystem
+    "org.springframework.boot": "spring-boot",
+    "org.springframework.cloud": "spring-cloud",
+    "org.springframework.data": "spring-data",
+    "org.springframework.security": "spring-security",
+    "org.springframework.kafka": "spring-kafka",
+    "org.springframework": "spring",
+    "io.awspring.cloud": "spring-cloud-aws",
+    # Apache
+    "org.apache.commons": "commons",
+    "org.apache.kafka": "kafka",
+    "org.apache.solr": "solr",
+    "org.apache.lucene": "lucene",
+    "org.apache.httpcomponents": "httpcomponents",
+    "org.apache.logging.log4j": "log4j",
+    # Jackson
+    "com.fasterxml.jackson.core": "jackson",
+    "com.fasterxml.jackson.module": "jackson-module",
+    "com.fasterxml.jackson.datatype": "jackson-datatype",
+    "com.fasterxml.jackson.dataformat": "jackson-dataformat",
+    # Reactive / observability
+    "io.projectreactor": "reactor",
+    "io.micrometer": "micrometer",
+    # Quarkus
+    "io.quarkus.platform": "quarkus-platform",
+    "io.quarkus": "quarkus",
+    # Micronaut
+    "io.micronaut.data": "micronaut-data",
+    "io.micronaut.sql": "micronaut-sql",
+    "io.micronaut.serde": "micronaut-serde",
+    "io.micronaut.test": "micronaut-test",
+    "io.micronaut.testresources": "micronaut-testresources",
+    "io.micronaut.flyway": "micronaut-flyway",
+    "io.micronaut.validation": "micronaut-validation",
+    "io.micronaut": "micronaut",
+    # Networking / gRPC
+    "io.grpc": "grpc",
+    "io.netty": "netty",
+    # Resilience
+    "io.github.resilience4j": "resilience4j",
+    # Testing
+    "org.junit.jupiter": "junit-jupiter",
+    "org.mockito": "mockito",
+    "org.assertj": "assertj",
+    "org.testcontainers": "testcontainers",
+    "org.mock-server": "mockserver",
+    "org.wiremock": "wiremock",
+    "com.github.tomakehurst": "wiremock",
+    "org.awaitility": "awaitility",
+    # Logging
+    "ch.qos.logback": "logback",
+    "org.slf4j": "slf4j",
+    # ORM / database
+    "org.hibernate.orm": "hibernate",
+    "org.hibernate.validator": "hibernate-validator",
+    "org.mongodb": "mongodb",
+    "org.postgresql": "postgresql",
+    "com.h2database": "h2",
+    "com.mysql": "mysql",
+    "org.flywaydb": "flyway",
+    "org.liquibase": "liquibase",
+    "redis.clients": "redis",
+    # AWS
+    "software.amazon.awssdk": "aws",
+    "com.amazonaws": "aws-classic",
+    # Build / annotation processing
+    "org.projectlombok": "lombok",
+    "org.mapstruct": "mapstruct",
+    "com.google.guava": "guava",
+    "com.google.cloud.tools": "google-cloud-tools",
+    # Jakarta / Javax
+    "jakarta.": "jakarta",
+    "javax.": "javax",
 }
 
+# Distinct prefix lengths, longest first. to_alias() slices the groupId at each
+# length and does a hashed lookup instead of scanning every prefix.
+_PREFIX_LENGTHS = sorted({len(k) for k in _PREFIX_MAP}, reverse=True)
 
+
+@functools.lru_cache(maxsize=4096)
 def to_alias(group_id: str, artifact_id: str) -> str:
     """Generate a Gradle version catalog alias from Maven GAV coordinates.
 
-    Uses a ``prefix_map`` to collapse common groupId prefixes into short,
+    Uses ``_PREFIX_MAP`` to collapse common groupId prefixes into short,
     idiomatic catalog aliases. For example:
 
         org.springframework.boot : spring-boot-starter-web → spring-boot-starter-web
         org.testcontainers       : testcontainers-postgresql → testcontainers-postgresql
         io.awspring.cloud        : spring-cloud-aws-starter-s3 → spring-cloud-aws-starter-s3
 
-    The prefix_map is ordered with more-specific prefixes before less-specific
-    ones (e.g. ``io.micronaut.data`` before ``io.micronaut``) because matching
-    uses ``str.startswith()`` with first-match-wins semantics.
+    The longest matching prefix wins (e.g. ``io.micronaut.data`` over
+    ``io.micronaut``), found by slicing the groupId at each known prefix
+    length and probing the map directly.
 
     Anti-stutter logic prevents aliases like ``spring-boot-spring-boot-starter-web``
     by detecting when the artifact_id already starts with the prefix words.
@@ -93,89 +197,10 @@ def to_alias(group_id: str, artifact_id: str) -> str:
     Returns:
         A sanitized kebab-case alias string suitable for ``libs.versions.toml``.
     """
-    # Common group prefixes to strip for cleaner aliases.
-    # ORDERING MATTERS: more-specific prefixes must come before less-specific
-    # ones because matching uses startswith() with first-match-wins.
-    prefix_map = {
-        # Spring ecosystem
-        "org.springframework.boot": "spring-boot",
-        "org.springframework.cloud": "spring-cloud",
-        "org.springframework.data": "spring-data",
-        "org.springframework.security": "spring-security",
-        "org.springframework.kafka": "spring-kafka",
-        "org.springframework": "spring",
-        "io.awspring.cloud": "spring-cloud-aws",
-        # Apache
-        "org.apache.commons": "commons",
-        "org.apache.kafka": "kafka",
-        "org.apache.solr": "solr",
-        "org.apache.lucene": "lucene",
-        "org.apache.httpcomponents": "httpcomponents",
-        "org.apache.logging.log4j": "log4j",
-        # Jackson
-        "com.fasterxml.jackson.core": "jackson",
-        "com.fasterxml.jackson.module": "jackson-module",
-        "com.fasterxml.jackson.datatype": "jackson-datatype",
-        "com.fasterxml.jackson.dataformat": "jackson-dataformat",
-        # Reactive / observability
-        "io.projectreactor": "reactor",
-        "io.micrometer": "micrometer",
-        # Quarkus (more-specific before less-specific)
-        "io.quarkus.platform": "quarkus-platform",
-        "io.quarkus": "quarkus",
-        # Micronaut (more-specific before less-specific)
-        "io.micronaut.data": "micronaut-data",
-        "io.micronaut.sql": "micronaut-sql",
-        "io.micronaut.serde": "micronaut-serde",
-        "io.micronaut.test": "micronaut-test",
-        "io.micronaut.testresources": "micronaut-testresources",
-        "io.micronaut.flyway": "micronaut-flyway",
-        "io.micronaut.validation": "micronaut-validation",
-        "io.micronaut": "micronaut",
-        # Networking / gRPC
-        "io.grpc": "grpc",
-        "io.netty": "netty",
-        # Resilience
-        "io.github.resilience4j": "resilience4j",
-        # Testing
-        "org.junit.jupiter": "junit-jupiter",
-        "org.mockito": "mockito",
-        "org.assertj": "assertj",
-        "org.testcontainers": "testcontainers",
-        "org.mock-server": "mockserver",
-        "org.wiremock": "wiremock",
-        "com.github.tomakehurst": "wiremock",
-        "org.awaitility": "awaitility",
-        # Logging
-        "ch.qos.logback": "logback",
-        "org.slf4j": "slf4j",
-        # ORM / database
-        "org.hibernate.orm": "hibernate",
-        "org.hibernate.validator": "hibernate-validator",
-        "org.mongodb": "mongodb",
-        "org.postgresql": "postgresql",
-        "com.h2database": "h2",
-        "com.mysql": "mysql",
-        "org.flywaydb": "flyway",
-        "org.liquibase": "liquibase",
-        "redis.clients": "redis",
-        # AWS
-        "software.amazon.awssdk": "aws",
-        "com.amazonaws": "aws-classic",
-        # Build / annotation processing
-        "org.projectlombok": "lombok",
-        "org.mapstruct": "mapstruct",
-        "com.google.guava": "guava",
-        "com.google.cloud.tools": "google-cloud-tools",
-        # Jakarta / Javax
-        "jakarta.": "jakarta",
-        "javax.": "javax",
-    }
-
     alias_prefix = None
-    for maven_prefix, catalog_prefix in prefix_map.items():
-        if group_id.startswith(maven_prefix):
-            alias_prefix = catalog_prefix
+    for length in _PREFIX_LENGTHS:
+        alias_prefix = _PREFIX_MAP.get(group_id[:length])
+        if alias_prefix:
             break
 
     if alias_prefix:
@@ -209,11 +234,14 @@ def to_alias(group_id: str, artifact_id: str) -> str:
             alias = f"{group_last}-{artifact_id}"
 
     # Sanitize: Gradle catalog aliases use kebab-case (hyphens, dots, or underscores)
-    alias = re.sub(r"[^a-zA-Z0-9\-]", "-", alias)
-    alias = re.sub(r"-+", "-", alias).strip("-").lower()
+    alias = alias.translate(_SANITIZE_TABLE)
+    if "--" in alias:
+        alias = _RE_DEDUP_DASH.sub("-", alias)
+    alias = alias.strip("-").lower()
     return alias
 
 
+@functools.lru_cache(maxsize=4096)
 def to_version_key(name: str) -> str:
     """Sanitize a name into a kebab-case version reference key.
 
@@ -226,9 +254,10 @@ def to_version_key(name: str) -> str:
     Returns:
         A clean kebab-case key suitable for the ``[versions]`` section.
     """
-    return re.sub(r"[^a-zA-Z0-9\-]", "-", name).strip("-").lower()
+    return name.translate(_SANITIZE_TABLE).strip("-").lower()
 
 
+@functools.lru_cache(maxsize=4096)
 def to_plugin_alias(group_id: str, artifact_id: str) -> str:
     """Generate a plugin alias for the version catalog ``[plugins]`` section.
 
@@ -5,37 +5,108 @@ Maven-to-Gradle migration pipeline.
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from .pom_models import MavenModule
-from .pom_parser import parse_pom
+from .pom_parser import parse_pom_cached, parse_poms
 from .gradle_file_generator import (
     build_version_catalog,
+    merge_properties,
+    project_context,
     generate_build_gradle_kts,
     generate_settings_gradle_kts,
     generate_gradle_properties,
     generate_gradle_gitignore_entries,
 )
 
+# Horizontal rule framing each file header in the dry-run report
+_RULE = "=" * 60
+
+# Closing summary printed after writing files; {children} holds one
+# indented line per child build file.
+_EPILOGUE_FILES = """
+Generated files:
+  gradle/libs.versions.toml
+  settings.gradle.kts
+  build.gradle.kts
+  gradle.properties
+{children}
+⚠️  Next steps:
+  1. Review generated files and adjust as needed
+  2. Run: gradle wrapper  # uses your installed Gradle version
+  3. Run: ./gradlew build
+  4. Fix any compilation or test issues
+"""
+_EPILOGUE_MIGRATE = (
+    "\n✅ Migration complete! Generated files in: {out}\n"
+    + _EPILOGUE_FILES
+    + "  5. Delete pom.xml files once migration is verified\n"
+)
+_EPILOGUE_OVERLAY = (
+    "\n✅ Gradle overlay complete! Generated files in: {out}\n"
+    + _EPILOGUE_FILES
+    + "  5. Both Maven and Gradle builds are now available side by side\n"
+    "     Keep pom.xml and build.gradle.kts in sync when adding dependencies\n"
+    "     See references/dual-build.md for maintenance guidance\n"
+)
+
+# Below this many files to write, writes are done serially; thread start-up
+# costs more than it saves on small projects.
+_PARALLEL_THRESHOLD = 8
+
+
+def _header(title: str) -> str:
+    """Format a dry-run file header.
+
+    Args:
+        title: The file name shown in the header.
+
+    Returns:
+        The title framed by ``_RULE`` lines, ending with a newline.
+    """
+    return f"{_RULE}\n{title}\n{_RULE}\n"
+
+
+def _dry_run_report(sections: list[tuple[str, str]]) -> str:
+    """Render the ``--dry-run`` report for the generated files.
+
+    Each file is shown under its ``_header()``, followed by its content;
+    files are separated by a blank line.
+
+    Args:
+        sections: ``(title, content)`` pairs, in display order.
+
+    Returns:
+        The complete report, ready to be written to stdout in one call.
+    """
+    return "\n".join(f"{_header(title)}{content}\n" for title, content in sections)
+
 
 def _parse_modules_recursive(
     project_path: Path,
     module_dirs: list[str],
     parent_path: str = "",
+    cache_dir: Optional[Path] = None,
+    jobs: Optional[int] = None,
     _visited: set = None,
 ) -> list[MavenModule]:
     """Recursively parse child modules, handling nested multi-module structures.
 
     If a child module itself declares ``<modules>``, those nested modules are
     also parsed and included in the result. Visited paths are tracked to
-    prevent infinite recursion from circular module references.
+    prevent infinite recursion from circular module references. The POMs of
+    sibling modules are parsed together via ``parse_poms()``.
 
     Args:
         project_path: Filesystem path to the root project.
         module_dirs: List of module directory names from the parent's ``<modules>``.
         parent_path: The relative path prefix for nested modules (e.g. ``"parent-mod"``).
+        cache_dir: Optional parse cache directory (see ``parse_pom_cached()``).
+        jobs: Maximum number of parallel workers (see ``parse_poms()``).
         _visited: Internal set of visited paths (callers should not set this).
 
     Returns:
@@ -45,33 +116,80 @@ def _parse_modules_recursive(
     if _visited is None:
         _visited = set()
 
-    result = []
+    # Plain string paths here: pathlib adds object churn per module and
+    # Path.resolve() walks the path in Python, unlike os.path.realpath()
+    root = os.fspath(project_path)
+    relative_dirs = []
+    pom_paths = []
     for mod_dir in module_dirs:
         relative_dir = f"{parent_path}/{mod_dir}" if parent_path else mod_dir
+        module_path = os.path.join(root, relative_dir)
         # Guard against circular references
-        abs_path = (project_path / relative_dir).resolve()
+        abs_path = os.path.realpath(module_path)
         if abs_path in _visited:
             continue
         _visited.add(abs_path)
 
-        child_pom = project_path / relative_dir / "pom.xml"
-        if child_pom.exists():
-            child = parse_pom(child_pom)
-            child.source_dir = relative_dir
-            result.append(child)
-            # Recurse into nested modules
-            if child.modules:
-                nested = _parse_modules_recursive(
-                    project_path, child.modules, relative_dir, _visited
-                )
-                result.extend(nested)
+        pom_path = os.path.join(module_path, "pom.xml")
+        if os.path.exists(pom_path):
+            relative_dirs.append(relative_dir)
+            pom_paths.append(Path(pom_path))
         else:
             print(f"WARNING: Module '{relative_dir}' has no pom.xml, skipping",
                   file=sys.stderr)
+
+    children = parse_poms(pom_paths, cache_dir, jobs)
+
+    result = []
+    for relative_dir, child in zip(relative_dirs, children):
+        child.source_dir = relative_dir
+        result.append(child)
+        # Recurse into nested modules
+        if child.modules:
+            nested = _parse_modules_recursive(
+                project_path, child.modules, relative_dir, cache_dir, jobs, _visited
+            )
+            result.extend(nested)
     return result
 
 
-def migrate(project_path: Path, output_path: Optional[Path] = None, dry_run: bool = False, mode: str = "migrate"):
+def _generate_child_builds(
+    root_module: MavenModule,
+    child_modules: list[MavenModule],
+    project_ctx: Optional[dict] = None,
+) -> list[str]:
+    """Generate ``build.gradle.kts`` content for every child module.
+
+    Generation is serial: rendering a build file takes microseconds, which a
+    worker pool's start-up and module pickling cost outweighs.
+
+    Args:
+        root_module: The parsed root MavenModule.
+        child_modules: All child modules, in include order.
+        project_ctx: Optional shared values from ``project_context()``.
+
+    Returns:
+        One build file content string per child, in the same order as
+        ``child_modules``.
+    """
+    return [
+        generate_build_gradle_kts(
+            child, root_module,
+            is_root=False, is_multi_module=True, child_modules=child_modules,
+            project_ctx=project_ctx,
+        )
+        for child in child_modules
+    ]
+
+
+def migrate(
+    project_path: Path,
+    output_path: Optional[Path] = None,
+    dry_run: bool = False,
+    mode: str = "migrate",
+    cache_dir: Optional[Path] = None,
+    jobs: Optional[int] = None,
+):
     """Run the full Maven-to-Gradle migration.
 
     Orchestrates the entire migration pipeline: parses all pom.xml files,
@@ -83,6 +201,9 @@ def migrate(project_path: Path, output_path: Optional[Path] = None, dry_run: boo
         output_path: Directory to write generated files to. Defaults to ``project_path``.
         dry_run: If ``True``, prints generated content to stdout instead of writing files.
         mode: ``"migrate"`` for full migration, ``"overlay"`` for dual-build (keeps Maven).
+        cache_dir: Optional directory for caching parsed POMs between runs.
+        jobs: Maximum number of parallel workers for parsing and writing
+            files. Defaults to the CPU count; 1 disables parallelism.
     """
     root_pom = project_path / "pom.xml"
     if not root_pom.exists():
@@ -90,7 +211,7 @@ def migrate(project_path: Path, output_path: Optional[Path] = None, dry_run: boo
         sys.exit(1)
 
     out = output_path or project_path
-    root_module = parse_pom(root_pom)
+    root_module = parse_pom_cached(root_pom, cache_dir)
     root_module.source_dir = "."
 
     is_multi = bool(root_module.modules)
@@ -98,119 +219,93 @@ def migrate(project_path: Path, output_path: Optional[Path] = None, dry_run: boo
     # Parse child modules (recursively for nested multi-module projects)
     child_modules = []
     if is_multi:
-        child_modules = _parse_modules_recursive(project_path, root_module.modules)
+        child_modules = _parse_modules_recursive(
+            project_path, root_module.modules, cache_dir=cache_dir, jobs=jobs,
+        )
 
     # Generate files
-    catalog_content = build_version_catalog(root_module, child_modules)
+    all_properties = merge_properties(root_module, child_modules)
+    catalog_content = build_version_catalog(root_module, child_modules, all_properties)
     settings_content = generate_settings_gradle_kts(root_module, child_modules)
+    project_ctx = project_context(root_module, child_modules)
     root_build_content = generate_build_gradle_kts(
         root_module, root_module,
         is_root=True, is_multi_module=is_multi, child_modules=child_modules,
+        project_ctx=project_ctx,
     )
     gradle_props = generate_gradle_properties(root_module)
+    child_builds = _generate_child_builds(root_module, child_modules, project_ctx)
 
     is_overlay = mode == "overlay"
 
     if dry_run:
-        print("=" * 60)
-        print("gradle/libs.versions.toml")
-        print("=" * 60)
-        print(catalog_content)
-        print()
-        print("=" * 60)
-        print("settings.gradle.kts")
-        print("=" * 60)
-        print(settings_content)
-        print()
-        print("=" * 60)
-        print("build.gradle.kts (root)")
-        print("=" * 60)
-        print(root_build_content)
-        print()
-        print("=" * 60)
-        print("gradle.properties")
-        print("=" * 60)
-        print(gradle_props)
-
-        for child in child_modules:
-            child_build = generate_build_gradle_kts(
-                child, root_module,
-                is_root=False, is_multi_module=True, child_modules=child_modules,
-            )
-            print()
-            print("=" * 60)
-            print(f"{child.source_dir}/build.gradle.kts")
-            print("=" * 60)
-            print(child_build)
-
+        sections = [
+            ("gradle/libs.versions.toml", catalog_content),
+            ("settings.gradle.kts", settings_content),
+            ("build.gradle.kts (root)", root_build_content),
+            ("gradle.properties", gradle_props),
+        ]
+        for child, child_build in zip(child_modules, child_builds):
+            sections.append((f"{child.source_dir}/build.gradle.kts", child_build))
         if is_overlay:
-            print()
-            print("=" * 60)
-            print(".gitignore (append)")
-            print("=" * 60)
-            print(generate_gradle_gitignore_entries())
+            sections.append((".gitignore (append)", generate_gradle_gitignore_entries()))
+        sys.stdout.write(_dry_run_report(sections))
     else:
-        _write(out / "gradle" / "libs.versions.toml", catalog_content)
-        _write(out / "settings.gradle.kts", settings_content)
-        _write(out / "build.gradle.kts", root_build_content)
-        _write(out / "gradle.properties", gradle_props)
-
-        for child in child_modules:
-            child_build = generate_build_gradle_kts(
-                child, root_module,
-                is_root=False, is_multi_module=True, child_modules=child_modules,
-            )
-            _write(out / child.source_dir / "build.gradle.kts", child_build)
+        files = [
+            (out / "gradle" / "libs.versions.toml", catalog_content),
+            (out / "settings.gradle.kts", settings_content),
+            (out / "build.gradle.kts", root_build_content),
+            (out / "gradle.properties", gradle_props),
+        ]
+        for child, child_build in zip(child_modules, child_builds):
+            files.append((out / child.source_dir / "build.gradle.kts", child_build))
+        _write_files(files, jobs)
 
         if is_overlay:
             # Append Gradle entries to .gitignore
             gitignore_path = out / ".gitignore"
             gitignore_entries = generate_gradle_gitignore_entries()
             if gitignore_path.exists():
-                existing = gitignore_path.read_text(encoding="utf-8")
-                if ".gradle/" not in existing:
-                    with open(gitignore_path, "a", encoding="utf-8") as f:
-                        f.write("\n" + gitignore_entries)
+                # Scan raw lines (no decoding); the marker is usually near the top
+                with open(gitignore_path, "rb") as f:
+                    has_gradle_entries = any(b".gradle/" in line for line in f)
+                if not has_gradle_entries:
+                    with open(gitignore_path, "ab") as f:
+                        f.write(("\n" + gitignore_entries).encode("utf-8"))
                     print(f"  ✓ {gitignore_path} (appended Gradle entries)")
                 else:
                     print(f"  ⏭ {gitignore_path} (Gradle entries already present)")
             else:
-                _write(gitignore_path, gitignore_entries)
+                _write_files([(gitignore_path, gitignore_entries)])
+
+        children = "".join(f"  {child.source_dir}/build.gradle.kts\n" for child in child_modules)
+        epilogue = _EPILOGUE_OVERLAY if is_overlay else _EPILOGUE_MIGRATE
+        sys.stdout.write(epilogue.format(out=out, children=children))
 
-        if is_overlay:
-            print(f"\n✅ Gradle overlay complete! Generated files in: {out}")
-        else:
-            print(f"\n✅ Migration complete! Generated files in: {out}")
-        print("\nGenerated files:")
-        print("  gradle/libs.versions.toml")
-        print("  settings.gradle.kts")
-        print("  build.gradle.kts")
-        print("  gradle.properties")
-        for child in child_modules:
-            print(f"  {child.source_dir}/build.gradle.kts")
-        print("\n⚠️  Next steps:")
-        print("  1. Review generated files and adjust as needed")
-        print("  2. Run: gradle wrapper  # uses your installed Gradle version")
-        print("  3. Run: ./gradlew build")
-        print("  4. Fix any compilation or test issues")
-        if is_overlay:
-            print("  5. Both Maven and Gradle builds are now available side by side")
-            print("     Keep pom.xml and build.gradle.kts in sync when adding dependencies")
-            print("     See references/dual-build.md for maintenance guidance")
-        else:
-            print("  5. Delete pom.xml files once migration is verified")
 
+def _write_files(files: list[tuple[Path, str]], jobs: Optional[int] = None):
+    """Write generated files, creating parent directories as needed.
 
-def _write(path: Path, content: str):
-    """Write content to a file, creating parent directories as needed.
+    Each distinct parent directory is created once, content is written as
+    UTF-8 bytes (``\\n`` line endings on every platform), and the ``✓``
+    report for the whole batch is printed in one write. Batches of at least
+    ``_PARALLEL_THRESHOLD`` files are written from a thread pool so that the
+    writes overlap; file I/O releases the GIL.
 
     Args:
-        path: Filesystem path to write to.
-        content: File content string (UTF-8 encoded).
+        files: ``(path, content)`` pairs, written and reported in order.
+        jobs: Maximum number of writer threads; 1 writes serially.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
-    print(f"  ✓ {path}")
+    for parent in {path.parent for path, _ in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    if jobs == 1 or len(files) < _PARALLEL_THRESHOLD:
+        for path, content in files:
+            path.write_bytes(content.encode("utf-8"))
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            # list() re-raises the first write error, if any
+            list(pool.map(lambda f: f[0].write_bytes(f[1].encode("utf-8")), files))
+    sys.stdout.write("".join(f"  ✓ {path}\n" for path, _ in files))
 
 
 def parse_args(argv=None):
@@ -221,7 +316,7 @@ def parse_args(argv=None):
 
     Returns:
         Parsed ``argparse.Namespace`` with ``project``, ``output``,
-        ``dry_run``, and ``mode`` attributes.
+        ``dry_run``, ``mode``, ``cache_dir``, and ``jobs`` attributes.
     """
     parser = argparse.ArgumentParser(
         description="Migrate Maven project to Gradle KTS with version catalogs"
@@ -233,10 +328,22 @@ def parse_args(argv=None):
         "--mode", "-m", choices=["migrate", "overlay"], default="migrate",
         help="'migrate' (default) for full migration, 'overlay' for dual-build (keeps Maven)"
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None,
+        help="Cache parsed pom.xml files in this directory to speed up repeated runs "
+             "(use a private directory; entries are trusted as parse results)"
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None,
+        help="Maximum parallel workers for large projects (default: CPU count; 1 disables parallelism)"
+    )
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
 
 
 def main():
     """CLI entry point. Parses arguments and delegates to ``migrate()``."""
     args = parse_args()
-    migrate(args.project, args.output, args.dry_run, args.mode)
+    migrate(args.project, args.output, args.dry_run, args.mode, args.cache_dir, args.jobs)
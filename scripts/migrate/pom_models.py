@@ -1,14 +1,23 @@
 """Maven data model classes.
 
 Pure data structures representing parsed Maven POM elements.
-No behavior or imports from other migrate modules.
+No behavior beyond derived read-only properties, and no imports from other migrate modules.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
+# Use __slots__ where supported (Python 3.10+) to shrink per-instance memory;
+# large reactors produce thousands of Dependency and Plugin instances.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Artifacts that mark a module as using annotation processing even when they
+# are not declared with provided scope.
+_ANNOTATION_PROCESSOR_ARTIFACTS = frozenset({"lombok", "mapstruct-processor"})
+
+
+@dataclass(**_SLOTS)
 class Dependency:
     """A Maven ``<dependency>`` element.
 
@@ -34,8 +43,13 @@ class Dependency:
     optional: bool = False
     exclusions: list = field(default_factory=list)
 
+    @property
+    def is_bom(self) -> bool:
+        """Whether this is a BOM import (``type=pom``, ``scope=import``)."""
+        return self.dep_type == "pom" and self.scope == "import"
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Plugin:
     """A Maven ``<plugin>`` element.
 
@@ -51,7 +65,7 @@ class Plugin:
     configuration: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MavenProfile:
     """A Maven ``<profile>`` element.
 
@@ -73,7 +87,7 @@ class MavenProfile:
     properties: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MavenModule:
     """Central parse result for a single ``pom.xml`` file.
 
@@ -118,3 +132,16 @@ class MavenModule:
     modules: list = field(default_factory=list)
     repositories: list = field(default_factory=list)
     source_dir: Optional[str] = None
+
+    @property
+    def has_tests(self) -> bool:
+        """Whether any direct dependency has test scope."""
+        return any(dep.scope == "test" for dep in self.dependencies)
+
+    @property
+    def has_annotation_processor(self) -> bool:
+        """Whether any direct dependency is provided-scoped or Lombok/MapStruct."""
+        return any(
+            dep.scope == "provided" or dep.artifact_id in _ANNOTATION_PROCESSOR_ARTIFACTS
+            for dep in self.dependencies
+        )
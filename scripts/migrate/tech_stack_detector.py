@@ -9,6 +9,22 @@ from typing import Optional
 from .pom_models import Dependency, MavenModule
 from .pom_parser import resolve_property
 
+# Property names that may carry the target Java version, in order of preference.
+_JAVA_VERSION_KEYS = (
+    "java.version", "maven.compiler.release", "maven.compiler.source",
+    "maven.compiler.target", "jdk.version", "java.source.version",
+)
+
+# maven-compiler-plugin ``<configuration>`` keys, in order of preference.
+_COMPILER_VERSION_KEYS = ("release", "source", "target")
+
+
+def _normalize_java_version(ver: str) -> str:
+    """Normalize legacy ``1.x`` Java versions to ``x`` (e.g. ``1.8`` → ``8``)."""
+    if ver.startswith("1.") and len(ver) <= 4:
+        return ver[2:]
+    return ver
+
 
 def detect_java_version(properties: dict, plugins: list) -> Optional[str]:
     """Extract the target Java version from Maven properties or compiler plugin config.
@@ -24,26 +40,17 @@ def detect_java_version(properties: dict, plugins: list) -> Optional[str]:
     Returns:
         Java version string (e.g. ``"21"``), or ``None`` if not detected.
     """
-    for prop_name in [
-        "java.version", "maven.compiler.release", "maven.compiler.source",
-        "maven.compiler.target", "jdk.version", "java.source.version",
-    ]:
-        if prop_name in properties:
-            ver = properties[prop_name]
-            # Normalize: 1.8 → 8, 11 → 11
-            if ver.startswith("1.") and len(ver) <= 4:
-                ver = ver[2:]
-            return ver
+    ver = next((properties[k] for k in _JAVA_VERSION_KEYS if k in properties), None)
+    if ver is not None:
+        return _normalize_java_version(ver)
     # Check compiler plugin configuration
     for p in plugins:
-        if p.artifact_id == "maven-compiler-plugin":
-            for key in ["release", "source", "target"]:
-                if key in p.configuration:
-                    ver = p.configuration[key]
-                    ver = resolve_property(ver, properties) or ver
-                    if ver.startswith("1.") and len(ver) <= 4:
-                        ver = ver[2:]
-                    return ver
+        if p.artifact_id != "maven-compiler-plugin":
+            continue
+        key = next((k for k in _COMPILER_VERSION_KEYS if k in p.configuration), None)
+        if key is not None:
+            ver = p.configuration[key]
+            return _normalize_java_version(resolve_property(ver, properties) or ver)
     return None
 
 
@@ -70,7 +77,7 @@ def detect_kotlin_version(properties: dict, plugins: list) -> Optional[str]:
     return None
 
 
-def is_spring_boot_project(module: MavenModule) -> bool:
+def is_spring_boot_project(module: MavenModule, all_plugins: Optional[list] = None) -> bool:
     """Check whether the module is a Spring Boot project.
 
     Detection checks:
@@ -79,13 +86,17 @@ def is_spring_boot_project(module: MavenModule) -> bool:
 
     Args:
         module: The root MavenModule to check.
+        all_plugins: The module's plugins plus pluginManagement entries, if the
+            caller has already combined them.
 
     Returns:
         ``True`` if Spring Boot is detected.
     """
-    return module.parent_artifact_id == "spring-boot-starter-parent" or any(
-        p.artifact_id == "spring-boot-maven-plugin" for p in module.plugins + module.plugin_management
-    )
+    if module.parent_artifact_id == "spring-boot-starter-parent":
+        return True
+    if all_plugins is None:
+        all_plugins = module.plugins + module.plugin_management
+    return any(p.artifact_id == "spring-boot-maven-plugin" for p in all_plugins)
 
 
 def is_devtools(dep: Dependency) -> bool:
@@ -1,12 +1,17 @@
 """Tests for gradle_file_generator.py — Gradle file generation."""
 
 from migrate.gradle_file_generator import (
+    _inter_module_coords,
     _is_inter_module_dep,
+    _library_entry,
+    _safe_alias,
     build_version_catalog,
     generate_build_gradle_kts,
     generate_settings_gradle_kts,
     generate_gradle_properties,
     generate_gradle_gitignore_entries,
+    merge_properties,
+    project_context,
 )
 from migrate.pom_models import Dependency, MavenModule, MavenProfile, Plugin
 
@@ -168,6 +173,22 @@ class TestBuildVersionCatalog:
         versions_section = catalog.split("[libraries]")[0]
         assert versions_section.count('"2.0.0"') == 1
 
+    def test_version_deduplication_never_reuses_java_ref(self):
+        module = MavenModule(
+            group_id="com.example",
+            artifact_id="demo",
+            properties={"java.version": "21"},
+            dependencies=[
+                Dependency(group_id="com.acme", artifact_id="lib-a", version="21"),
+                Dependency(group_id="com.acme", artifact_id="lib-b", version="21"),
+            ],
+        )
+        catalog = build_version_catalog(module, [])
+        assert 'java = "21"' in catalog
+        assert 'acme-lib-a = "21"' in catalog
+        assert 'version.ref = "java"' not in catalog
+        assert catalog.count('version.ref = "acme-lib-a"') == 2
+
     def test_dependency_no_version_no_managed(self):
         module = MavenModule(
             group_id="com.example",
@@ -345,6 +366,35 @@ class TestBuildVersionCatalog:
         # 'core' is inter-module — should not appear
         assert "core =" not in lib_section
 
+    def test_child_override_reaches_catalog(self):
+        root = MavenModule(
+            group_id="com.example", artifact_id="parent", packaging="pom",
+            properties={"lib.base": "1.0", "lib.version": "${lib.base}"},
+        )
+        child = MavenModule(
+            group_id="com.example", artifact_id="app",
+            properties={"lib.base": "2.0"},
+            dependencies=[Dependency(group_id="com.x", artifact_id="lib", version="${lib.version}")],
+        )
+        toml = build_version_catalog(root, [child])
+        assert 'x-lib = "2.0"' in toml
+
+    def test_catalog_uses_given_properties(self):
+        root = MavenModule(
+            group_id="com.example", artifact_id="demo",
+            dependencies=[Dependency(group_id="com.acme", artifact_id="lib", version="${lib.version}")],
+        )
+        toml = build_version_catalog(root, [], {"lib.version": "3.0"})
+        assert '"3.0"' in toml
+
+    def test_version_with_special_characters_escaped(self):
+        root = MavenModule(
+            group_id="com.example", artifact_id="demo",
+            dependencies=[Dependency(group_id="com.acme", artifact_id="lib", version='1.0"rc\\2')],
+        )
+        toml = build_version_catalog(root, [])
+        assert 'acme-lib = "1.0\\"rc\\\\2"' in toml
+
 
 class TestGenerateBuildGradleKts:
     def test_single_module_has_plugins_block(self, simple_module):
@@ -917,6 +967,28 @@ class TestGenerateBuildGradleKts:
         # Not provided/optional → no compileOnly
         assert "compileOnly(" not in build
 
+    def test_bom_mutated_after_construction(self):
+        bom = Dependency(group_id="com.acme", artifact_id="acme-bom", version="1.0", dep_type="pom")
+        module = MavenModule(
+            group_id="com.example", artifact_id="demo",
+            dependencies=[Dependency(group_id="com.acme", artifact_id="lib")],
+            dep_management=[bom],
+        )
+        assert "platform(" not in generate_build_gradle_kts(module, module)
+        bom.scope = "import"
+        assert "implementation(platform(libs." in generate_build_gradle_kts(module, module)
+
+    def test_dependencies_appended_after_construction(self):
+        module = MavenModule(group_id="com.example", artifact_id="demo")
+        assert "useJUnitPlatform" not in generate_build_gradle_kts(module, module)
+        module.dependencies.append(
+            Dependency(group_id="org.junit.jupiter", artifact_id="junit-jupiter", scope="test")
+        )
+        assert "useJUnitPlatform" in generate_build_gradle_kts(module, module)
+        assert module.has_annotation_processor is False
+        module.dependencies.append(Dependency(group_id="org.projectlombok", artifact_id="lombok"))
+        assert module.has_annotation_processor is True
+
 
 class TestGenerateSettingsGradleKts:
     def test_root_project_name(self, simple_module):
@@ -1080,10 +1152,29 @@ class TestGenerateGradleProperties:
         body = props.split("# Generated")[1]
         assert "kotlin" not in body.lower()
 
+    def test_prefix_must_be_whole_segment(self):
+        module = MavenModule(
+            group_id="com.example",
+            artifact_id="demo",
+            properties={"javax.version": "1", "maven": "2", "project.name": "demo"},
+        )
+        props = generate_gradle_properties(module)
+        assert "# javax_version=1" in props
+        assert "# maven=2" in props
+        assert "# project_name=demo" in props
+
     def test_configuration_cache_comment(self, simple_module):
         props = generate_gradle_properties(simple_module)
         assert "configuration-cache" in props
 
+    def test_property_references_carried_over_unresolved(self):
+        module = MavenModule(
+            group_id="com.example",
+            artifact_id="demo",
+            properties={"lib.base": "1.0", "lib.version": "${lib.base}"},
+        )
+        assert "# lib_version=${lib.base}" in generate_gradle_properties(module)
+
 
 class TestGenerateGitignoreEntries:
     def test_contains_gradle_dir(self):
@@ -1107,6 +1198,81 @@ class TestGenerateGitignoreEntries:
         assert "!**/src/test/**/build/" in content
 
 
+class TestMergeProperties:
+    def test_children_override_root(self):
+        root = MavenModule(group_id="g", artifact_id="root", properties={"a": "1", "b": "1"})
+        child = MavenModule(group_id="g", artifact_id="child", properties={"b": "2", "c": "2"})
+        assert merge_properties(root, [child]) == {"a": "1", "b": "2", "c": "2"}
+
+    def test_returns_copy(self):
+        root = MavenModule(group_id="g", artifact_id="root", properties={"a": "1"})
+        merge_properties(root, [])["a"] = "2"
+        assert root.properties == {"a": "1"}
+
+    def test_chains_resolve_after_child_overrides(self):
+        root = MavenModule(
+            group_id="g", artifact_id="root",
+            properties={"lib.base": "1.0", "lib.version": "${lib.base}"},
+        )
+        child = MavenModule(group_id="g", artifact_id="child", properties={"lib.base": "2.0"})
+        assert merge_properties(root, [child])["lib.version"] == "2.0"
+        assert root.properties["lib.version"] == "${lib.base}"
+
+
+class TestProjectContext:
+    def test_spring_boot_parent(self):
+        root = MavenModule(
+            group_id="com.example", artifact_id="demo",
+            parent_group_id="org.springframework.boot",
+            parent_artifact_id="spring-boot-starter-parent",
+            plugins=[Plugin(group_id="org.apache.maven.plugins", artifact_id="maven-jar-plugin")],
+        )
+        ctx = project_context(root)
+        assert ctx["is_boot"] is True
+        assert [p.artifact_id for p in ctx["root_all_plugins"]] == ["maven-jar-plugin"]
+
+    def test_build_uses_given_context(self):
+        root = MavenModule(group_id="com.example", artifact_id="demo")
+        ctx = {"root_all_plugins": [], "is_boot": True}
+        result = generate_build_gradle_kts(root, root, project_ctx=ctx)
+        assert "alias(libs.plugins.spring.boot)" in result
+
+    def test_inter_module_coords(self):
+        root = MavenModule(group_id="com.example", artifact_id="parent")
+        child = MavenModule(group_id="com.example", artifact_id="core", source_dir="libs/core")
+        ctx = project_context(root, [child])
+        assert ctx["inter_module_coords"] == {
+            ("com.example", "parent"): ".",
+            ("com.example", "core"): "libs/core",
+        }
+
+
+class TestLibraryEntry:
+    def test_with_version_ref(self):
+        assert _library_entry("com.acme", "lib", "acme-lib") == (
+            '{ group = "com.acme", name = "lib", version.ref = "acme-lib" }'
+        )
+
+    def test_without_version_ref(self):
+        assert _library_entry("com.acme", "lib") == '{ group = "com.acme", name = "lib" }'
+
+    def test_quotes_escaped(self):
+        assert _library_entry('com."acme"', "lib") == '{ group = "com.\\"acme\\"", name = "lib" }'
+
+
+class TestSafeAlias:
+    def test_dashes_become_dots(self):
+        assert _safe_alias("org.springframework.boot", "spring-boot-starter-web") == (
+            "spring.boot.starter.web"
+        )
+
+    def test_matches_build_reference(self):
+        mod = MavenModule(group_id="com.acme", artifact_id="app",
+                          dependencies=[Dependency("com.acme.lib", "core-utils", "1.0")])
+        result = generate_build_gradle_kts(mod, mod)
+        assert f"implementation(libs.{_safe_alias('com.acme.lib', 'core-utils')})" in result
+
+
 class TestIsInterModuleDep:
     def test_child_module_is_inter_module(self):
         root = MavenModule(group_id="com.example", artifact_id="parent")
@@ -1114,19 +1280,19 @@ class TestIsInterModuleDep:
             group_id="com.example", artifact_id="core", source_dir="core",
         )
         dep = Dependency(group_id="com.example", artifact_id="core")
-        result = _is_inter_module_dep(dep, root, [child])
+        result = _is_inter_module_dep(dep, _inter_module_coords(root, [child]))
         assert result == "core"
 
     def test_root_module_is_inter_module(self):
         root = MavenModule(group_id="com.example", artifact_id="parent")
         dep = Dependency(group_id="com.example", artifact_id="parent")
-        result = _is_inter_module_dep(dep, root, [])
+        result = _is_inter_module_dep(dep, _inter_module_coords(root, []))
         assert result == "."
 
     def test_external_dep_returns_none(self):
         root = MavenModule(group_id="com.example", artifact_id="parent")
         dep = Dependency(group_id="org.springframework", artifact_id="spring-core")
-        result = _is_inter_module_dep(dep, root, [])
+        result = _is_inter_module_dep(dep, _inter_module_coords(root, []))
         assert result is None
 
     def test_matching_artifact_different_group_returns_none(self):
@@ -1135,5 +1301,5 @@ class TestIsInterModuleDep:
             group_id="com.example", artifact_id="core", source_dir="core",
         )
         dep = Dependency(group_id="com.other", artifact_id="core")
-        result = _is_inter_module_dep(dep, root, [child])
+        result = _is_inter_module_dep(dep, _inter_module_coords(root, [child]))
         assert result is None
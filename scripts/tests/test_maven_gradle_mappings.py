@@ -52,6 +52,12 @@ class TestToAlias:
         alias = to_alias("com.acme.foobar", "foobar-utils")
         assert alias == "foobar-utils"
 
+    # Longest prefix wins
+    def test_longest_prefix_wins(self):
+        assert to_alias("io.micronaut.testresources", "server") == "micronaut-testresources-server"
+        assert to_alias("io.micronaut.data", "jdbc") == "micronaut-data-jdbc"
+        assert to_alias("io.micronaut.other", "core") == "micronaut-core"
+
     # AWS
     def test_aws_sdk(self):
         assert to_alias("software.amazon.awssdk", "s3") == "aws-s3"
@@ -3,7 +3,13 @@
 import textwrap
 from pathlib import Path
 
-from migrate.migration_pipeline import migrate, _parse_modules_recursive, parse_args
+from migrate import migration_pipeline
+from migrate.migration_pipeline import (
+    migrate, _dry_run_report, _generate_child_builds, _parse_modules_recursive,
+    _write_files, parse_args,
+)
+from migrate.gradle_file_generator import project_context
+from migrate.pom_models import Dependency, MavenModule
 
 
 class TestParseModulesRecursive:
@@ -318,6 +324,62 @@ class TestParseModulesCircularReference:
         assert len(modules) == 2
 
 
+class TestDryRunReport:
+    def test_sections_framed_and_separated(self):
+        rule = "=" * 60
+        report = _dry_run_report([("a.txt", "A"), ("b.txt", "B")])
+        assert report == f"{rule}\na.txt\n{rule}\nA\n\n{rule}\nb.txt\n{rule}\nB\n"
+
+    def test_empty(self):
+        assert _dry_run_report([]) == ""
+
+
+class TestWriteFiles:
+    def _files(self, tmp_path):
+        return [(tmp_path / f"mod{i}" / "build.gradle.kts", f"// {i}\n") for i in range(3)]
+
+    def test_serial_writes_and_reports_in_order(self, tmp_path, capsys):
+        files = self._files(tmp_path)
+        _write_files(files)
+        assert [p.read_text() for p, _ in files] == ["// 0\n", "// 1\n", "// 2\n"]
+        out = capsys.readouterr().out
+        assert out.splitlines() == [f"  ✓ {p}" for p, _ in files]
+
+    def test_threaded_matches_serial(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(migration_pipeline, "_PARALLEL_THRESHOLD", 1)
+        files = self._files(tmp_path)
+        _write_files(files)
+        assert [p.read_bytes() for p, _ in files] == [b"// 0\n", b"// 1\n", b"// 2\n"]
+        assert capsys.readouterr().out.splitlines() == [f"  ✓ {p}" for p, _ in files]
+
+
+class TestGenerateChildBuilds:
+    def _modules(self, count):
+        root = MavenModule(
+            group_id="com.example", artifact_id="parent", packaging="pom",
+            modules=[f"mod{i}" for i in range(count)],
+        )
+        children = [
+            MavenModule(
+                group_id="com.example", artifact_id=f"mod{i}", source_dir=f"mod{i}",
+                dependencies=[Dependency(group_id="com.example", artifact_id=f"mod{i - 1}")] if i else [],
+            )
+            for i in range(count)
+        ]
+        return root, children
+
+    def test_serial_preserves_order(self):
+        root, children = self._modules(3)
+        builds = _generate_child_builds(root, children)
+        assert len(builds) == 3
+        assert 'implementation(project(":mod1"))' in builds[2]
+
+    def test_shared_context_matches_default(self):
+        root, children = self._modules(3)
+        ctx = project_context(root, children)
+        assert _generate_child_builds(root, children, ctx) == _generate_child_builds(root, children)
+
+
 class TestParseArgs:
     def test_defaults(self, tmp_path):
         args = parse_args([str(tmp_path)])
@@ -325,6 +387,8 @@ class TestParseArgs:
         assert args.output is None
         assert args.dry_run is False
         assert args.mode == "migrate"
+        assert args.cache_dir is None
+        assert args.jobs is None
 
     def test_dry_run_flag(self, tmp_path):
         args = parse_args([str(tmp_path), "--dry-run"])
@@ -340,6 +404,19 @@ class TestParseArgs:
         args = parse_args([str(tmp_path), "--mode", "overlay"])
         assert args.mode == "overlay"
 
+    def test_cache_dir(self, tmp_path):
+        args = parse_args([str(tmp_path), "--cache-dir", str(tmp_path / "cache")])
+        assert args.cache_dir == tmp_path / "cache"
+
+    def test_jobs(self, tmp_path):
+        assert parse_args([str(tmp_path), "--jobs", "4"]).jobs == 4
+        assert parse_args([str(tmp_path), "-j", "1"]).jobs == 1
+
+    def test_jobs_below_one_exits(self, tmp_path):
+        import pytest
+        with pytest.raises(SystemExit):
+            parse_args([str(tmp_path), "--jobs", "0"])
+
     def test_invalid_mode_exits(self):
         import pytest
         with pytest.raises(SystemExit):
@@ -2,9 +2,12 @@
 
 from migrate.pom_parser import (
     parse_pom,
+    parse_poms,
+    parse_pom_cached,
     resolve_property,
     is_bom_import,
     _parse_plugin_config,
+    _iter_local,
 )
 from migrate.pom_models import Dependency
 
@@ -39,6 +42,18 @@ class TestParsePom:
         assert module.artifact_id == "ns-demo"
         assert module.packaging == "war"
 
+    def test_other_pom_namespace(self, tmp_pom):
+        pom = tmp_pom("""\
+            <?xml version="1.0" encoding="UTF-8"?>
+            <project xmlns="http://maven.apache.org/POM/4.1.0">
+                <groupId>com.example</groupId>
+                <artifactId>ns41-demo</artifactId>
+            </project>
+        """)
+        module = parse_pom(pom)
+        assert module.group_id == "com.example"
+        assert module.artifact_id == "ns41-demo"
+
     def test_parent_inheritance(self, tmp_pom):
         pom = tmp_pom("""\
             <?xml version="1.0" encoding="UTF-8"?>
@@ -73,6 +88,24 @@ class TestParsePom:
         assert module.properties["java.version"] == "21"
         assert module.properties["spring-cloud.version"] == "2024.0.0"
 
+    def test_property_references_kept_raw(self, tmp_pom):
+        pom = tmp_pom("""\
+            <?xml version="1.0" encoding="UTF-8"?>
+            <project>
+                <groupId>com.example</groupId>
+                <artifactId>demo</artifactId>
+                <properties>
+                    <lib.version>${base.version}</lib.version>
+                    <base.version>2.1</base.version>
+                    <parent.only>${defined.elsewhere}</parent.only>
+                </properties>
+            </project>
+        """)
+        module = parse_pom(pom)
+        # Resolved only after merging with other modules
+        assert module.properties["lib.version"] == "${base.version}"
+        assert module.properties["parent.only"] == "${defined.elsewhere}"
+
     def test_dependencies_parsed(self, tmp_pom):
         pom = tmp_pom("""\
             <?xml version="1.0" encoding="UTF-8"?>
@@ -449,6 +482,204 @@ class TestParsePom:
         assert len(module.repositories) == 1
         assert module.repositories[0] == ("spring-milestones", "https://repo.spring.io/milestone")
 
+    def test_dependency_flags_derived(self, tmp_pom):
+        pom = tmp_pom("""\
+            <?xml version="1.0" encoding="UTF-8"?>
+            <project>
+                <groupId>com.example</groupId>
+                <artifactId>demo</artifactId>
+                <dependencies>
+                    <dependency>
+                        <groupId>org.projectlombok</groupId>
+                        <artifactId>lombok</artifactId>
+                    </dependency>
+                    <dependency>
+                        <groupId>org.junit.jupiter</groupId>
+                        <artifactId>junit-jupiter</artifactId>
+                        <scope>test</scope>
+                    </dependency>
+                </dependencies>
+            </project>
+        """)
+        module = parse_pom(pom)
+        assert module.has_tests is True
+        assert module.has_annotation_processor is True
+
+    def test_dependency_flags_default_false(self, tmp_pom):
+        pom = tmp_pom("""\
+            <?xml version="1.0" encoding="UTF-8"?>
+            <project>
+                <groupId>com.example</groupId>
+                <artifactId>demo</artifactId>
+            </project>
+        """)
+        module = parse_pom(pom)
+        assert module.has_tests is False
+        assert module.has_annotation_processor is False
+
+    def test_comments_and_unused_sections_ignored(self, tmp_pom):
+        pom = tmp_pom("""\
+            <?xml version="1.0" encoding="UTF-8"?>
+            <project>
+                <!-- coordinates -->
+                <groupId>com.example</groupId>
+                <artifactId>demo</artifactId>
+                <reporting>
+                    <plugins><plugin><artifactId>site-plugin</artifactId></plugin></plugins>
+                </reporting>
+                <dependencies>
+                    <!-- web -->
+                    <dependency>
+                        <groupId>org.example</groupId>
+                        <artifactId>lib</artifactId>
+                    </dependency>
+                </dependencies>
+                <name>Demo</name>
+            </project>
+        """)
+        module = parse_pom(pom)
+        assert module.group_id == "com.example"
+        assert module.name == "Demo"
+        assert [d.artifact_id for d in module.dependencies] == ["lib"]
+        assert module.plugins == []
+
+
+class TestParsePoms:
+    def _write_poms(self, tmp_path, count):
+        paths = []
+        for i in range(count):
+            d = tmp_path / f"mod{i}"
+            d.mkdir()
+            pom = d / "pom.xml"
+            pom.write_text(
+                "<project><groupId>com.example</groupId>"
+                f"<artifactId>mod{i}</artifactId></project>",
+                encoding="utf-8",
+            )
+            paths.append(pom)
+        return paths
+
+    def test_serial_preserves_order(self, tmp_path):
+        modules = parse_poms(self._write_poms(tmp_path, 3))
+        assert [m.artifact_id for m in modules] == ["mod0", "mod1", "mod2"]
+
+    def test_parallel_preserves_order(self, tmp_path, monkeypatch):
+        from migrate import pom_parser
+        monkeypatch.setattr(pom_parser, "_PARALLEL_THRESHOLD", 1)
+        modules = parse_poms(self._write_poms(tmp_path, 10), jobs=2)
+        assert [m.artifact_id for m in modules] == [f"mod{i}" for i in range(10)]
+
+    def test_single_job_parses_serially(self, tmp_path, monkeypatch):
+        from migrate import pom_parser
+        monkeypatch.setattr(pom_parser, "_PARALLEL_THRESHOLD", 1)
+        monkeypatch.setattr(pom_parser, "ProcessPoolExecutor", None)
+        modules = parse_poms(self._write_poms(tmp_path, 10), jobs=1)
+        assert [m.artifact_id for m in modules] == [f"mod{i}" for i in range(10)]
+
+    def test_single_cpu_parses_serially(self, tmp_path, monkeypatch):
+        from migrate import pom_parser
+        monkeypatch.setattr(pom_parser, "_PARALLEL_THRESHOLD", 1)
+        monkeypatch.setattr(pom_parser, "ProcessPoolExecutor", None)
+        monkeypatch.setattr(pom_parser.os, "cpu_count", lambda: 1)
+        modules = parse_poms(self._write_poms(tmp_path, 10))
+        assert [m.artifact_id for m in modules] == [f"mod{i}" for i in range(10)]
+
+
+class TestParsePomCached:
+    POM = "<project><groupId>com.example</groupId><artifactId>{}</artifactId></project>"
+
+    def test_no_cache_dir_parses_directly(self, tmp_path):
+        pom = tmp_path / "pom.xml"
+        pom.write_text(self.POM.format("demo"), encoding="utf-8")
+        assert parse_pom_cached(pom).artifact_id == "demo"
+
+    def test_second_call_reads_cache(self, tmp_path, monkeypatch):
+        from migrate import pom_parser
+        pom = tmp_path / "pom.xml"
+        pom.write_text(self.POM.format("demo"), encoding="utf-8")
+        cache = tmp_path / "cache"
+        parse_pom_cached(pom, cache)
+        assert len(list(cache.iterdir())) == 1
+
+        def fail(_path):
+            raise AssertionError("parse_pom should not be called on a cache hit")
+        monkeypatch.setattr(pom_parser, "parse_pom", fail)
+        assert parse_pom_cached(pom, cache).artifact_id == "demo"
+
+    def test_modified_pom_invalidates_cache(self, tmp_path):
+        pom = tmp_path / "pom.xml"
+        cache = tmp_path / "cache"
+        pom.write_text(self.POM.format("old"), encoding="utf-8")
+        parse_pom_cached(pom, cache)
+        pom.write_text(self.POM.format("renamed"), encoding="utf-8")
+        assert parse_pom_cached(pom, cache).artifact_id == "renamed"
+
+    def test_format_version_bump_invalidates_cache(self, tmp_path, monkeypatch):
+        from migrate import pom_parser
+        pom = tmp_path / "pom.xml"
+        cache = tmp_path / "cache"
+        pom.write_text(self.POM.format("demo"), encoding="utf-8")
+        parse_pom_cached(pom, cache)
+        monkeypatch.setattr(pom_parser, "_CACHE_FORMAT_VERSION", pom_parser._CACHE_FORMAT_VERSION + 1)
+        parse_pom_cached(pom, cache)
+        assert len(list(cache.iterdir())) == 2
+
+    def test_corrupt_entry_treated_as_miss(self, tmp_path):
+        pom = tmp_path / "pom.xml"
+        cache = tmp_path / "cache"
+        pom.write_text(self.POM.format("demo"), encoding="utf-8")
+        parse_pom_cached(pom, cache)
+        for entry in cache.iterdir():
+            entry.write_bytes(b"not json")
+        assert parse_pom_cached(pom, cache).artifact_id == "demo"
+
+    def test_truncated_or_malformed_entry_treated_as_miss(self, tmp_path):
+        pom = tmp_path / "pom.xml"
+        cache = tmp_path / "cache"
+        pom.write_text(self.POM.format("demo"), encoding="utf-8")
+        parse_pom_cached(pom, cache)
+        (entry,) = cache.iterdir()
+        full = entry.read_bytes()
+        for content in (full[: len(full) // 2], b"[]", b'{"group_id": 1}', b"\xff\xfe"):
+            entry.write_bytes(content)
+            assert parse_pom_cached(pom, cache).artifact_id == "demo"
+
+    def test_cache_round_trip_matches_parse(self, tmp_pom, tmp_path):
+        pom = tmp_pom("""\
+            <?xml version="1.0" encoding="UTF-8"?>
+            <project xmlns="http://maven.apache.org/POM/4.0.0">
+                <groupId>com.example</groupId>
+                <artifactId>demo</artifactId>
+                <properties><lib.version>1.0</lib.version></properties>
+                <dependencies>
+                    <dependency>
+                        <groupId>com.acme</groupId>
+                        <artifactId>lib</artifactId>
+                        <version>${lib.version}</version>
+                        <exclusions>
+                            <exclusion><groupId>x</groupId><artifactId>y</artifactId></exclusion>
+                        </exclusions>
+                    </dependency>
+                </dependencies>
+                <build><plugins><plugin>
+                    <artifactId>maven-compiler-plugin</artifactId>
+                    <configuration><release>21</release><args><arg>-X</arg></args></configuration>
+                </plugin></plugins></build>
+                <profiles><profile>
+                    <id>dev</id>
+                    <activation><activeByDefault>true</activeByDefault></activation>
+                    <dependencies><dependency><groupId>g</groupId><artifactId>a</artifactId></dependency></dependencies>
+                </profile></profiles>
+                <repositories><repository><id>r</id><url>https://repo.example</url></repository></repositories>
+            </project>
+        """)
+        cache = tmp_path / "cache"
+        parsed = parse_pom_cached(pom, cache)
+        cached = parse_pom_cached(pom, cache)
+        assert cached == parsed == parse_pom(pom)
+        assert cached.dependencies[0].exclusions == [("x", "y")]
+        assert cached.repositories == [("r", "https://repo.example")]
+
 
 class TestResolveProperty:
     def test_simple_resolution(self):
@@ -476,8 +707,23 @@ class TestResolveProperty:
     def test_circular_reference_protection(self):
         props = {"a": "${b}", "b": "${a}"}
         result = resolve_property("${a}", props)
-        # Should not infinite loop; returns after depth limit
-        assert result is not None
+        # Should not infinite loop; stops at the first repeated property
+        assert result == "${a}"
+
+    def test_concatenated_references_resolved(self):
+        props = {"major": "1", "minor": "2"}
+        assert resolve_property("${major}.${minor}-SNAPSHOT", props) == "1.2-SNAPSHOT"
+
+    def test_partially_resolvable_keeps_unknown_reference(self):
+        assert resolve_property("${a}-${unknown}", {"a": "1"}) == "1-${unknown}"
+
+    def test_chain_inside_concatenation(self):
+        props = {"v": "${base}.1", "base": "3"}
+        assert resolve_property("lib-${v}", props) == "lib-3.1"
+
+    def test_project_prefix_only_stripped_as_prefix(self):
+        props = {"my.version": "1.0"}
+        assert resolve_property("${my.project.version}", props) == "${my.project.version}"
 
 
 class TestIsBomImport:
@@ -507,6 +753,36 @@ class TestIsBomImport:
         )
         assert is_bom_import(dep) is False
 
+    def test_flag_set_on_parsed_dependency(self, tmp_pom):
+        pom = tmp_pom("""\
+            <?xml version="1.0" encoding="UTF-8"?>
+            <project>
+                <groupId>com.example</groupId>
+                <artifactId>demo</artifactId>
+                <dependencyManagement>
+                    <dependencies>
+                        <dependency>
+                            <groupId>org.springframework.cloud</groupId>
+                            <artifactId>spring-cloud-dependencies</artifactId>
+                            <version>2024.0.0</version>
+                            <type>pom</type>
+                            <scope>import</scope>
+                        </dependency>
+                    </dependencies>
+                </dependencyManagement>
+            </project>
+        """)
+        dep = parse_pom(pom).dep_management[0]
+        assert dep.is_bom is True
+
+    def test_flag_follows_mutation(self):
+        dep = Dependency(group_id="com.example", artifact_id="bom", dep_type="pom")
+        assert dep.is_bom is False
+        dep.scope = "import"
+        assert dep.is_bom is True
+        dep.dep_type = None
+        assert dep.is_bom is False
+
 
 class TestParsePluginConfig:
     def test_none_returns_empty_dict(self):
@@ -548,3 +824,17 @@ class TestParsePluginConfig:
         assert isinstance(result["archive"], dict)
         assert "manifest" in result["archive"]
         assert "com.example.Main" in result["archive"]["manifest"]
+
+
+class TestIterLocal:
+    def test_matches_namespaced_and_plain_children_in_order(self):
+        import xml.etree.ElementTree as ET
+        deps = ET.fromstring(
+            '<dependencies xmlns:m="http://maven.apache.org/POM/4.0.0">'
+            "<m:dependency><artifactId>a</artifactId></m:dependency>"
+            "<exclusions/>"
+            "<dependency><artifactId>b</artifactId></dependency>"
+            "</dependencies>"
+        )
+        result = [c.find("artifactId").text for c in _iter_local(deps, "dependency")]
+        assert result == ["a", "b"]